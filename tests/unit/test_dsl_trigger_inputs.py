@@ -0,0 +1,95 @@
+import pytest
+from pydantic import ValidationError
+
+from tracecat.dsl.validation import (
+    _get_trigger_inputs_validator,
+    _has_json_native_fields,
+    normalize_trigger_inputs,
+)
+from tracecat.expressions.expectations import ExpectedField, freeze_expects
+
+
+def test_normalize_trigger_inputs_applies_defaults():
+    input_schema = {
+        "name": ExpectedField(type="str"),
+        "count": ExpectedField(type="int", default=1),
+        "tags": ExpectedField(type="list[str]", default=["a", "b"]),
+    }
+
+    normalized = normalize_trigger_inputs(input_schema, {"name": "alert"})
+
+    assert normalized == {"name": "alert", "count": 1, "tags": ["a", "b"]}
+
+
+def test_normalize_trigger_inputs_passthrough_without_schema():
+    payload = {"anything": 1}
+    assert normalize_trigger_inputs({}, payload) is payload
+    assert normalize_trigger_inputs({"x": ExpectedField(type="int")}, "raw") == "raw"
+
+
+def test_normalize_trigger_inputs_rejects_invalid_payload():
+    input_schema = {"count": ExpectedField(type="int")}
+
+    with pytest.raises(ValidationError):
+        normalize_trigger_inputs(input_schema, {"count": "not-a-number"})
+
+    with pytest.raises(ValidationError):
+        normalize_trigger_inputs(input_schema, {"count": 1, "extra": True})
+
+
+def test_normalize_trigger_inputs_reuses_validator_for_same_schema():
+    _get_trigger_inputs_validator.cache_clear()
+    input_schema = {
+        "severity": ExpectedField(type="enum['low','high']", default="low"),
+    }
+
+    assert normalize_trigger_inputs(input_schema, {}) == {"severity": "low"}
+    assert normalize_trigger_inputs(input_schema, {"severity": "high"}) == {
+        "severity": "high"
+    }
+
+    cache_info = _get_trigger_inputs_validator.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+
+    # A different schema shape must not reuse the cached validator
+    other_schema = {
+        "severity": ExpectedField(type="enum['low','high']", default="high"),
+    }
+    assert normalize_trigger_inputs(other_schema, {}) == {"severity": "high"}
+    assert _get_trigger_inputs_validator.cache_info().misses == 2
+
+
+def test_normalize_trigger_inputs_output_is_json_compatible():
+    flat_schema = {
+        "name": ExpectedField(type="str"),
+        "ratio": ExpectedField(type="float", default=0.5),
+        "level": ExpectedField(type="enum['low','high'] | None", default=None),
+        "tags": ExpectedField(type="list[str]", default=[]),
+    }
+    assert _has_json_native_fields(
+        _get_trigger_inputs_validator(
+            freeze_expects(flat_schema), "TriggerInputsNormalizer"
+        )
+    )
+    assert normalize_trigger_inputs(flat_schema, {"name": "x", "ratio": 1}) == {
+        "name": "x",
+        "ratio": 1.0,
+        "level": None,
+        "tags": [],
+    }
+
+    # Non-JSON types are still serialized through model_dump
+    rich_schema = {
+        "start": ExpectedField(type="datetime"),
+        "window": ExpectedField(type="duration", default="PT1H"),
+        "counts": ExpectedField(type="dict[int, int]", default={}),
+    }
+    normalized = normalize_trigger_inputs(
+        rich_schema, {"start": "2024-01-01T00:00:00Z", "counts": {"1": 2}}
+    )
+    assert normalized == {
+        "start": "2024-01-01T00:00:00Z",
+        "window": "PT1H",
+        "counts": {"1": 2},
+    }
@@ -1,12 +1,19 @@
 import json
+import uuid
 from datetime import datetime
-from typing import Any
+from enum import Enum
+from typing import Any, Literal
 
 import lark
 import pytest
 from pydantic import ValidationError
 
-from tracecat.expressions.expectations import ExpectedField, create_expectation_model
+from tracecat.expressions.expectations import (
+    ExpectedField,
+    _validate_expected_field,
+    create_expectation_model,
+    parse_type,
+)
 from tracecat.logger import logger
 from tracecat.workflow.management.utils import build_trigger_inputs_schema
 
@@ -462,3 +469,55 @@ def test_trigger_input_schema_default_values_are_applied():
     assert validated_instance_complete.message == "Custom message"
     assert validated_instance_complete.threshold == 0.75
     assert validated_instance_complete.tags == ["custom", "tags"]
+
+
+class _Color(Enum):
+    RED = 1
+
+
+def test_validate_expected_field_memoizes_raw_mappings():
+    field = ExpectedField(type="int", default=1)
+    assert _validate_expected_field(field) is field
+
+    first = _validate_expected_field({"type": "list[str]", "default": ["a"]})
+    # Key order does not affect the cache key
+    second = _validate_expected_field({"default": ["a"], "type": "list[str]"})
+    assert first is second
+    assert first.type == "list[str]"
+    assert first.default == ["a"]
+
+    # Explicit None default is distinct from no default
+    assert _validate_expected_field({"type": "int", "default": None}).has_default()
+    assert not _validate_expected_field({"type": "int"}).has_default()
+
+    # Non-JSON values fall back to uncached validation
+    dt = datetime(2024, 1, 1)
+    dt_field = _validate_expected_field({"type": "datetime", "default": dt})
+    assert dt_field.default is dt
+
+    # Values orjson encodes natively but that aren't JSON keep their type
+    tuple_field = _validate_expected_field({"type": "any", "default": ("a",)})
+    assert tuple_field.default == ("a",)
+    assert isinstance(tuple_field.default, tuple)
+
+    uid = uuid.uuid4()
+    uuid_field = _validate_expected_field({"type": "str", "default": uid})
+    assert uuid_field.default is uid
+
+    color_field = _validate_expected_field({"type": "any", "default": _Color.RED})
+    assert color_field.default is _Color.RED
+
+    with pytest.raises(ValidationError):
+        _validate_expected_field({"type": "int", "unknown": True})
+
+
+def test_parse_type_caches_by_type_string():
+    first = parse_type("list[enum['a', 'b']]", "first_field")
+    second = parse_type("list[enum['a', 'b']]", "second_field")
+    assert first is second
+    assert first == list[Literal["a", "b"]]
+
+    # Parse errors are not cached and keep raising
+    for _ in range(2):
+        with pytest.raises(lark.exceptions.UnexpectedCharacters):
+            parse_type("enum[]", "bad_field")
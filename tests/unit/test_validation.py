@@ -50,7 +50,7 @@ from tracecat.registry.repository import Repository
 from tracecat.registry.versions.schemas import RegistryVersionManifestAction
 from tracecat.registry.versions.service import RegistryVersionsService
 from tracecat.validation.schemas import ActionValidationResult, ValidationResultType
-from tracecat.validation.service import validate_dsl
+from tracecat.validation.service import validate_dsl, validate_entrypoint_expects
 
 TEST_VERSION = "test-version"
 
@@ -1080,3 +1080,30 @@ async def test_agent_tool_approvals_passes_with_feature_flag(
     ]
 
     assert len(action_errors) == 0
+
+
+def test_validate_entrypoint_expects_reports_errors_per_field():
+    assert (
+        validate_entrypoint_expects(
+            {"count": {"type": "int", "default": 1}, "name": {"type": "str"}}
+        )
+        == []
+    )
+
+    results = validate_entrypoint_expects(
+        {
+            "valid": {"type": "int"},
+            "bad_schema": {"typ": "str"},
+            "bad_type": {"type": "enum[]"},
+        }
+    )
+
+    assert [r.ref for r in results] == ["bad_schema", "bad_type"]
+    bad_schema, bad_type = results
+    assert bad_schema.detail is not None
+    assert {d.loc for d in bad_schema.detail} == {
+        ("entrypoint", "expects", "bad_schema", "typ"),
+        ("entrypoint", "expects", "bad_schema", "type"),
+    }
+    assert bad_type.detail is not None
+    assert [d.type for d in bad_type.detail] == ["entrypoint.expects.type"]
@@ -1,4 +1,8 @@
-from tracecat.workflow.management.utils import build_trigger_inputs_schema
+from tracecat.expressions.expectations import ExpectedField
+from tracecat.workflow.management.utils import (
+    _inline_schema_refs,
+    build_trigger_inputs_schema,
+)
 
 
 def test_build_trigger_inputs_schema_generates_json_schema():
@@ -23,3 +27,82 @@ def test_build_trigger_inputs_schema_generates_json_schema():
 
     severity_schema = properties["severity"]
     assert severity_schema["enum"] == ["low", "high"]
+
+
+def test_inline_schema_refs_resolves_nested_refs_in_single_pass():
+    schema = {
+        "type": "object",
+        "properties": {
+            "outer": {"$ref": "#/$defs/Outer", "description": "Override"},
+            "items": {"type": "array", "items": {"$ref": "#/$defs/Inner"}},
+        },
+        "$defs": {
+            "Outer": {
+                "type": "object",
+                "description": "Outer model",
+                "properties": {"inner": {"$ref": "#/$defs/Inner"}},
+            },
+            "Inner": {"type": "string", "enum": ["a", "b"]},
+        },
+    }
+
+    assert _inline_schema_refs(schema, schema["$defs"]) == (True, False)
+
+    outer = schema["properties"]["outer"]
+    assert "$ref" not in outer
+    assert outer["description"] == "Override"
+    assert outer["properties"]["inner"] == {"type": "string", "enum": ["a", "b"]}
+    assert schema["properties"]["items"]["items"] == {
+        "type": "string",
+        "enum": ["a", "b"],
+    }
+    # Inlined definitions must not alias each other
+    assert outer["properties"]["inner"] is not schema["properties"]["items"]["items"]
+    assert _inline_schema_refs(schema, schema["$defs"]) == (False, False)
+
+
+def test_inline_schema_refs_reports_unresolved_refs_outside_defs():
+    schema = {
+        "type": "object",
+        "properties": {
+            "known": {"$ref": "#/$defs/Known"},
+            "external": {"$ref": "https://example.com/schema.json"},
+        },
+        "$defs": {
+            "Known": {"type": "integer"},
+            "Dangling": {"$ref": "#/$defs/Missing"},
+        },
+    }
+
+    assert _inline_schema_refs(schema, schema["$defs"]) == (True, True)
+    assert schema["properties"]["known"] == {"type": "integer"}
+    assert schema["properties"]["external"] == {
+        "$ref": "https://example.com/schema.json"
+    }
+
+    # Unresolved refs inside $defs alone do not count as remaining refs
+    del schema["properties"]["external"]
+    assert _inline_schema_refs(schema, schema["$defs"]) == (False, False)
+
+
+def test_build_trigger_inputs_schema_returns_independent_copies():
+    expects = {
+        "case_id": {"type": "str"},
+        "tags": {"type": "list[str]", "default": ["a"]},
+    }
+
+    first = build_trigger_inputs_schema(expects)
+    assert first is not None
+    first["properties"]["tags"]["default"].append("mutated")
+
+    # Equivalent expects (ExpectedField instances, reordered keys) share the
+    # cached schema, but callers never see each other's mutations
+    second = build_trigger_inputs_schema(
+        {
+            "case_id": ExpectedField(type="str"),
+            "tags": {"default": ["a"], "type": "list[str]"},
+        }
+    )
+    assert second is not None
+    assert second["properties"]["tags"]["default"] == ["a"]
+    assert second == build_trigger_inputs_schema(expects)
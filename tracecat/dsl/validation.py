@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable, Sequence
 from datetime import datetime
+from types import NoneType, UnionType
+from typing import Any, Literal, Union, get_args, get_origin
 
 from pydantic import BaseModel
 from temporalio import activity
@@ -9,12 +12,49 @@ from temporalio import activity
 from tracecat.dsl.schemas import TriggerInputs
 from tracecat.expressions.expectations import (
     ExpectedField,
+    FrozenExpects,
     create_expectation_model,
+    freeze_expects,
+    thaw_expects,
 )
 from tracecat.validation.schemas import ValidationDetail
 from tracecat.workflow.executions.enums import TriggerType
 
 
+@functools.lru_cache(maxsize=256)
+def _get_trigger_inputs_validator(
+    frozen_expects: FrozenExpects, model_name: str
+) -> type[BaseModel]:
+    """Build the expectation model for a frozen expects schema.
+
+    Building a Pydantic model is expensive, so models are cached by schema shape
+    and reused across trigger invocations with the same `expects`.
+    """
+    return create_expectation_model(thaw_expects(frozen_expects), model_name=model_name)
+
+
+_JSON_SCALAR_TYPES = (str, int, float, bool, NoneType)
+
+
+def _is_json_native(annotation: Any) -> bool:
+    """Whether validated values of `annotation` are already JSON-compatible."""
+    if annotation is None or annotation in _JSON_SCALAR_TYPES:
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return all(isinstance(arg, str) for arg in get_args(annotation))
+    if origin in (list, Union, UnionType):
+        return all(_is_json_native(arg) for arg in get_args(annotation))
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _has_json_native_fields(model: type[BaseModel]) -> bool:
+    return all(
+        _is_json_native(field.annotation) for field in model.model_fields.values()
+    )
+
+
 def normalize_trigger_inputs(
     input_schema: dict[str, ExpectedField],
     payload: TriggerInputs,
@@ -30,13 +70,12 @@ def normalize_trigger_inputs(
     if not isinstance(payload, dict) or not input_schema:
         return payload
 
-    expects_schema = {
-        field_name: ExpectedField.model_validate(field_schema)
-        for field_name, field_schema in input_schema.items()
-    }
     # Build a pydantic model from schema and dump with defaults applied
-    validator = create_expectation_model(expects_schema, model_name=model_name)
-    model = validator(**payload)
+    validator = _get_trigger_inputs_validator(freeze_expects(input_schema), model_name)
+    model = validator.model_validate(payload)
+    if _has_json_native_fields(validator):
+        # Flat schemas (scalars, enums, lists of them) already hold JSON values
+        return dict(model.__dict__)
     return model.model_dump(mode="json")
 
 
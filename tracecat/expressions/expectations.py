@@ -1,9 +1,11 @@
+import functools
 from collections.abc import Mapping
 from datetime import datetime, timedelta
 from typing import Any, Literal, Union
 
+import orjson
 from lark import Lark, Transformer, v_args
-from pydantic import BaseModel, ConfigDict, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
 from pydantic_core import to_jsonable_python
 
 from tracecat.expressions.schemas import ExpectedField
@@ -11,7 +13,14 @@ from tracecat.logger import logger
 from tracecat.registry.fields import get_components_for_union_type, type_drop_null
 
 # Re-export for backwards compatibility
-__all__ = ["ExpectedField", "create_expectation_model"]
+__all__ = [
+    "ExpectedField",
+    "ExpectedFieldsAdapter",
+    "FrozenExpects",
+    "create_expectation_model",
+    "freeze_expects",
+    "thaw_expects",
+]
 
 type_grammar = r"""
 ?type: primitive_type
@@ -72,10 +81,6 @@ TYPE_MAPPING = {
 class TypeTransformer(Transformer):
     MAX_ENUM_VALUES = 20
 
-    def __init__(self, field_name: str):
-        super().__init__()
-        self.field_name = field_name
-
     @v_args(inline=True)
     def primitive_type(self, item) -> type | None:
         logger.trace("Primitive type:", item=item)
@@ -133,7 +138,7 @@ class TypeTransformer(Transformer):
             literal_values.append(value)
 
         literal_type = Literal.__getitem__(tuple(literal_values))  # pyright: ignore[reportAttributeAccessIssue]
-        logger.trace("Enum literal type:", field=self.field_name, values=literal_values)
+        logger.trace("Enum literal type:", values=literal_values)
         return literal_type
 
     @v_args(inline=True)
@@ -143,9 +148,88 @@ class TypeTransformer(Transformer):
         return value
 
 
-def parse_type(type_string: str, field_name: str) -> Any:
+@functools.lru_cache(maxsize=512)
+def _parse_type_cached(type_string: str) -> Any:
     tree = type_parser.parse(type_string)
-    return TypeTransformer(field_name).transform(tree)
+    return TypeTransformer().transform(tree)
+
+
+def parse_type(type_string: str, field_name: str) -> Any:
+    """Parse a type string into a Python type.
+
+    Parsed types are cached by type string, as the set of distinct type strings
+    is small. ``field_name`` is only used for trace logging.
+    """
+    logger.trace("Parsing type", field=field_name, type_string=type_string)
+    return _parse_type_cached(type_string)
+
+
+ExpectedFieldsAdapter: TypeAdapter[dict[str, ExpectedField]] = TypeAdapter(
+    dict[str, ExpectedField]
+)
+"""Validates a whole `expects` mapping in a single call."""
+
+
+@functools.lru_cache(maxsize=1024)
+def _validate_expected_field_json(field_json: bytes) -> ExpectedField:
+    return ExpectedField.model_validate_json(field_json)
+
+
+def _validate_expected_field(
+    field_schema: ExpectedField | Mapping[str, Any],
+) -> ExpectedField:
+    """Validate a field schema into an :class:`ExpectedField`.
+
+    Raw mappings are memoized by their canonical JSON encoding, so the same
+    instance is returned for equal mappings. The result is shared and must be
+    treated as read-only; use ``ExpectedField.model_validate`` when the caller
+    needs an instance it can mutate. Mappings that don't survive a JSON
+    round-trip unchanged (e.g. tuple, UUID or Enum values) are validated
+    without caching, so their value types are preserved.
+    """
+    if isinstance(field_schema, ExpectedField):
+        return field_schema
+    try:
+        field_json = orjson.dumps(
+            field_schema,
+            option=orjson.OPT_SORT_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS,
+        )
+    except TypeError:
+        return ExpectedField.model_validate(field_schema)
+    # orjson natively encodes some non-JSON values, which would come back as
+    # different types after validating from JSON.
+    if orjson.loads(field_json) != field_schema:
+        return ExpectedField.model_validate(field_schema)
+    return _validate_expected_field_json(field_json)
+
+
+type FrozenExpects = tuple[tuple[str, str], ...]
+"""Hashable `expects` form: ordered ``(field_name, ExpectedField JSON)`` pairs."""
+
+
+def freeze_expects(
+    expects: Mapping[str, ExpectedField | Mapping[str, Any]],
+) -> FrozenExpects:
+    """Canonicalize an `expects` mapping into a hashable cache key.
+
+    Field order is preserved as it determines the field order of models built
+    from the schema.
+    """
+    return tuple(
+        (field_name, _validate_expected_field(field_schema).model_dump_json())
+        for field_name, field_schema in expects.items()
+    )
+
+
+def thaw_expects(frozen_expects: FrozenExpects) -> dict[str, ExpectedField]:
+    """Rebuild the `expects` mapping from :func:`freeze_expects` output."""
+    return {
+        field_name: ExpectedField.model_validate_json(field_json)
+        for field_name, field_json in frozen_expects
+    }
 
 
 def create_expectation_model(
@@ -155,8 +239,11 @@ def create_expectation_model(
     fields = {}
     for field_name, field_info in schema.items():
         field_info_kwargs = {}
-        # Defensive validation
-        validated_field_info = ExpectedField.model_validate(field_info)
+        # Defensive validation, skipped for already-validated fields
+        if isinstance(field_info, ExpectedField):
+            validated_field_info = field_info
+        else:
+            validated_field_info = ExpectedField.model_validate(field_info)
 
         # Extract metadata
         field_type: type = parse_type(validated_field_info.type, field_name)
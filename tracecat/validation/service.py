@@ -25,7 +25,11 @@ from tracecat.exceptions import RegistryValidationError, TracecatNotFoundError
 from tracecat.expressions import patterns
 from tracecat.expressions.common import ExprType
 from tracecat.expressions.eval import extract_expressions, is_template_only
-from tracecat.expressions.expectations import ExpectedField, parse_type
+from tracecat.expressions.expectations import (
+    ExpectedField,
+    ExpectedFieldsAdapter,
+    parse_type,
+)
 from tracecat.expressions.validator.validator import (
     ExprValidationContext,
     ExprValidator,
@@ -576,11 +580,20 @@ def validate_entrypoint_expects(
     if not expects:
         return []
 
+    # Validate all fields in a single call. Only fall back to per-field
+    # validation when something is invalid, so errors map to their field.
+    try:
+        validated_fields = ExpectedFieldsAdapter.validate_python(expects)
+    except ValidationError:
+        validated_fields = {}
+
     results: list[DSLValidationResult] = []
     for field_name, raw_field in expects.items():
         details: list[ValidationDetail] = []
         try:
-            validated_field = ExpectedField.model_validate(raw_field)
+            validated_field = validated_fields.get(field_name)
+            if validated_field is None:
+                validated_field = ExpectedField.model_validate(raw_field)
         except ValidationError as e:
             for detail in ValidationDetail.list_from_pydantic(e):
                 loc = ("entrypoint", "expects", field_name)
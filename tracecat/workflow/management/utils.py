@@ -2,73 +2,83 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Mapping
 from copy import deepcopy
 from typing import Any
 
+import orjson
+
 from tracecat.expressions.expectations import (
     ExpectedField,
+    FrozenExpects,
     create_expectation_model,
+    freeze_expects,
+    thaw_expects,
 )
 
 
-def _inline_schema_refs(node: Any, defs: dict[str, Any] | None) -> bool:
-    """Inline ``$ref`` entries pointing to ``defs`` in-place.
+def _clone_json(value: Any) -> Any:
+    """Clone a JSON-compatible value.
 
-    Returns ``True`` if at least one replacement was made. This helper walks the
-    full JSON schema tree so nested definitions (e.g. inside ``items``) are also
-    inlined.
+    Round-trips through orjson, which is much cheaper than ``deepcopy`` for
+    plain JSON trees. Values orjson can't serialize fall back to ``deepcopy``.
     """
 
-    if not defs:
-        return False
+    try:
+        return orjson.loads(orjson.dumps(value))
+    except TypeError:
+        return deepcopy(value)
 
-    replacement_made = False
 
-    def _walk(value: Any) -> None:
-        nonlocal replacement_made
+def _inline_schema_refs(node: Any, defs: dict[str, Any] | None) -> tuple[bool, bool]:
+    """Inline ``$ref`` entries pointing to ``defs`` in-place.
+
+    Returns a ``(replacement_made, refs_remaining)`` tuple. ``refs_remaining``
+    is ``True`` if a ``$ref`` outside of a ``$defs`` block could not be inlined.
+    The full JSON schema tree is traversed once with an explicit stack so
+    nested definitions (e.g. inside ``items``) are also inlined. Merged nodes
+    are revisited, so references introduced by an inlined definition are
+    resolved in the same pass.
+    """
+
+    # Map full ref strings to their definitions so each ``$ref`` resolves with a
+    # single lookup instead of being parsed.
+    ref_targets = {
+        f"#/$defs/{def_name}": definition
+        for def_name, definition in (defs or {}).items()
+    }
+    replacement_made = False
+    refs_remaining = False
+    # Each entry tracks whether the node sits inside a ``$defs`` block.
+    stack: list[tuple[Any, bool]] = [(node, False)]
+    while stack:
+        value, in_defs = stack.pop()
 
         if isinstance(value, dict):
-            ref = value.get("$ref")
-            if ref and ref.startswith("#/$defs/"):
-                def_name = ref.split("/")[-1]
-                if def_name in defs:
+            if "$ref" in value:
+                if (definition := ref_targets.get(value["$ref"])) is not None:
                     # Merge the referenced definition into the current node.
-                    referenced = deepcopy(defs[def_name])
+                    referenced = _clone_json(definition)
                     value.pop("$ref")
                     for key, ref_value in referenced.items():
                         # Preserve explicit field-level overrides.
                         value.setdefault(key, ref_value)
                     replacement_made = True
+                    # Revisit the merged node to resolve any refs it brought in.
+                    stack.append((value, in_defs))
+                    continue
+                if not in_defs:
+                    refs_remaining = True
 
-            for child in list(value.values()):
-                _walk(child)
+            stack.extend(
+                (child, in_defs or key == "$defs") for key, child in value.items()
+            )
 
         elif isinstance(value, list):
-            for item in list(value):
-                _walk(item)
-
-    _walk(node)
-    return replacement_made
+            stack.extend((item, in_defs) for item in value)
 
-
-def _schema_contains_refs(node: Any, *, skip_defs: bool = True) -> bool:
-    """Detect remaining ``$ref`` entries.``skip_defs`` ignores ``$defs`` nodes."""
-
-    if isinstance(node, dict):
-        for key, value in node.items():
-            if key == "$ref":
-                return True
-            if skip_defs and key == "$defs":
-                continue
-            if _schema_contains_refs(value, skip_defs=skip_defs):
-                return True
-        return False
-
-    if isinstance(node, list):
-        return any(_schema_contains_refs(item, skip_defs=skip_defs) for item in node)
-
-    return False
+    return replacement_made, refs_remaining
 
 
 def build_trigger_inputs_schema(
@@ -99,18 +109,28 @@ def build_trigger_inputs_schema(
     if not expects:
         return None
 
-    # Ensure we are working with validated ``ExpectedField`` instances so we
-    # can safely generate the Pydantic model and downstream schema.
-    validated_fields = {
-        field_name: ExpectedField.model_validate(field_schema)
-        for field_name, field_schema in expects.items()
-    }
+    # Validating the fields while freezing them lets us safely generate the
+    # Pydantic model and downstream schema. Callers get their own copy of the
+    # cached schema so they can't mutate it.
+    schema = _build_trigger_inputs_schema(freeze_expects(expects), model_name)
+    return _clone_json(schema) if schema is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _build_trigger_inputs_schema(
+    frozen_expects: FrozenExpects, model_name: str
+) -> dict[str, Any] | None:
+    """Build the trigger inputs JSON schema for a frozen expects schema.
+
+    Cached by schema shape, as building the Pydantic model and its JSON schema
+    is expensive and workflow definitions are read far more often than edited.
+    """
 
-    if not validated_fields:
+    if not frozen_expects:
         return None
 
     expectation_model = create_expectation_model(
-        validated_fields, model_name=model_name
+        thaw_expects(frozen_expects), model_name=model_name
     )
     schema = expectation_model.model_json_schema()
 
@@ -118,15 +138,14 @@ def build_trigger_inputs_schema(
     if schema and "$defs" in schema and isinstance(schema["$defs"], dict):
         schema_defs = schema["$defs"]
 
-        # Keep inlining until no more replacements are made. This handles nested
-        # references where a referenced definition itself contains another $ref.
-        while _inline_schema_refs(schema, schema_defs):
-            continue
+        # A single pass also resolves nested references where a referenced
+        # definition itself contains another $ref.
+        _, refs_remaining = _inline_schema_refs(schema, schema_defs)
 
         # Clean up $defs only if there are no remaining $ref entries outside of
         # the $defs block. Leaving $defs in place avoids breaking downstream
         # consumers when nested references are still present.
-        if not _schema_contains_refs(schema):
+        if not refs_remaining:
             schema.pop("$defs", None)
 
     return schema